@@ -6,13 +6,24 @@ Uses the official Kubernetes Python client library.
 """
 
 import sys
+import hashlib
 import os
+import queue
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import List, Dict, Set, Optional
+from itertools import groupby
+from operator import attrgetter
+from typing import FrozenSet, Iterable, Iterator, List, Dict, NamedTuple, Tuple, Optional
+import orjson
 from kubernetes import client, config
 from kubernetes.client.rest import ApiException
 from reportlab.lib.pagesizes import letter, A4
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
+from reportlab.pdfbase.pdfmetrics import stringWidth
+from reportlab.pdfgen import canvas
+from reportlab.platypus import Paragraph, Spacer, Table, TableStyle
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
 from reportlab.lib import colors
@@ -23,6 +34,65 @@ autoscaling_v2 = None
 core_v1 = None
 cluster_info = {}
 
+# Number of objects requested per page when listing resources
+LIST_PAGE_SIZE = 500
+
+# Number of pages fetched ahead of the page being processed
+PREFETCH_PAGES = 2
+
+# Number of namespaces listed in parallel when the scan is limited to namespaces
+NAMESPACE_FETCH_WORKERS = 4
+
+# Directory and lifetimes (seconds) of the on-disk cluster info and discovery caches
+CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'hpa-scanner')
+CLUSTER_INFO_TTL = 60
+DISCOVERY_TTL = 600
+
+# Maximum number of pooled connections to the API server
+CONNECTION_POOL_MAXSIZE = 16
+
+# Page geometry of the PDF report
+PAGE_WIDTH, PAGE_HEIGHT = A4
+PDF_MARGIN = inch
+
+# Columns of the resources table drawn directly on the PDF canvas
+RESOURCE_COLUMNS = ['Resource Type', 'Name', 'Replicas', 'RR']
+RESOURCE_COL_WIDTHS = [1.2*inch, 3*inch, 0.8*inch, 1.2*inch]
+RESOURCE_ROW_HEIGHT = 16
+
+# Styles of the PDF report, built once instead of on every report
+PDF_STYLES = getSampleStyleSheet()
+TITLE_STYLE = ParagraphStyle(
+    'CustomTitle',
+    parent=PDF_STYLES['Heading1'],
+    fontSize=18,
+    spaceAfter=30,
+    alignment=1,  # Center alignment
+    textColor=colors.darkblue
+)
+SUMMARY_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 12),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+    ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
+    ('GRID', (0, 0), (-1, -1), 1, colors.black),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE')
+])
+
+# Namespace prefixes treated as system namespaces and skipped by the scan
+SKIP_PREFIXES = ('kube-', 'system-')
+
+class Finding(NamedTuple):
+    """A resource without HPA reported by the scan."""
+    name: str
+    namespace: str
+    type: str
+    replicas: int
+    has_resource_requests: bool
+
 def initialize_kubernetes_client():
     """Initialize the Kubernetes client."""
     global apps_v1, autoscaling_v2, core_v1, cluster_info
@@ -49,139 +119,320 @@ def initialize_kubernetes_client():
             print(f"❌ Error loading Kubernetes config: {e}")
             sys.exit(1)
     
-    # Initialize API clients
-    apps_v1 = client.AppsV1Api()
-    autoscaling_v2 = client.AutoscalingV2Api()
-    core_v1 = client.CoreV1Api()
+    # Initialize API clients sharing one connection pool sized for the parallel fetches
+    configuration = client.Configuration.get_default_copy()
+    configuration.connection_pool_maxsize = CONNECTION_POOL_MAXSIZE
+    api_client = client.ApiClient(configuration)
+    # Large LIST bodies compress well, so ask the API server for gzip
+    api_client.set_default_header('Accept-Encoding', 'gzip')
+    apps_v1 = client.AppsV1Api(api_client)
+    autoscaling_v2 = client.AutoscalingV2Api(api_client)
+    core_v1 = client.CoreV1Api(api_client)
     
     # Test connectivity and get cluster info
     get_cluster_info()
+    cluster_info['groups'] = get_api_groups(api_client)
+
+def cache_path(kind: str, context: str) -> str:
+    """Return the path of the cache file of one kind for a context."""
+    # Hash the raw context name so that distinct contexts never share a file
+    digest = hashlib.sha256(context.encode('utf-8')).hexdigest()
+    return os.path.join(CACHE_DIR, kind, f"{digest}.json")
+
+def load_cache(path: str, ttl: float, keys: Tuple[str, ...]) -> Optional[Dict]:
+    """Return the data cached at path, or None if it is missing, malformed or older than ttl seconds."""
+    try:
+        with open(path, 'rb') as f:
+            entry = orjson.loads(f.read())
+    except (OSError, orjson.JSONDecodeError):
+        return None
+    if not isinstance(entry, dict) or not all(key in entry for key in keys):
+        return None
+    if time.time() - entry.get('fetched', 0) >= ttl:
+        return None
+    return entry
+
+def save_cache(path: str, data: Dict):
+    """Cache data at path; failures are ignored since the cache is only an optimization."""
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(orjson.dumps({**data, 'fetched': time.time()}))
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
+
+def fetch_cluster_info() -> Dict:
+    """Fetch the cluster version and namespaces from the API server."""
+    # Test connectivity by listing namespaces (simple and reliable)
+    namespaces = core_v1.list_namespace()
+    namespace_names = [ns.metadata.name for ns in namespaces.items or ()]
+    
+    # Try to get version info if possible; it only feeds a banner line, so any
+    # failure (API error, unexpected payload) falls back to 'unknown'
+    try:
+        version = client.VersionApi(core_v1.api_client).get_code().git_version or 'unknown'
+    except Exception:
+        version = 'unknown'
+    
+    return {
+        'version': version,
+        'ns_count': len(namespace_names),
+        # Decide once which namespaces are system namespaces skipped by the scan
+        'skip_ns': [name for name in namespace_names if name.startswith(SKIP_PREFIXES)]
+    }
 
 def get_cluster_info():
     """Get cluster information and test connectivity."""
     global cluster_info
     
+    # Reuse a recent probe of the same context instead of querying the cluster again
+    path = cache_path('cluster-info', cluster_info.get('context', 'unknown'))
+    info = load_cache(path, CLUSTER_INFO_TTL, ('version', 'ns_count', 'skip_ns'))
     try:
-        # Test connectivity by listing namespaces (simple and reliable)
-        namespaces = core_v1.list_namespace()
-        namespace_count = len(namespaces.items) if namespaces.items else 0
-        
-        print(f"🔗 Connected to cluster: {cluster_info.get('cluster', 'unknown')}")
-        print(f"📋 Found {namespace_count} namespaces")
-        
-        # Try to get version info if possible
-        try:
-            version_info = core_v1.get_code()
-            if hasattr(version_info, 'git_version'):
-                cluster_info['version'] = version_info.git_version
-                print(f"📋 Kubernetes version: {cluster_info['version']}")
-            else:
-                cluster_info['version'] = 'unknown'
-        except (ApiException, AttributeError):
-            cluster_info['version'] = 'unknown'
-            print(f"📋 Kubernetes version: {cluster_info['version']}")
-        
+        if info is None:
+            info = fetch_cluster_info()
+            save_cache(path, info)
+        else:
+            # A cached probe does not prove the cluster is reachable with the current
+            # credentials, so still make one cheap authenticated call
+            core_v1.list_namespace(limit=1)
     except ApiException as e:
         print(f"❌ Error connecting to cluster: {e}")
         sys.exit(1)
+    
+    cluster_info['version'] = info['version']
+    cluster_info['skip_ns'] = frozenset(info['skip_ns'])
+    
+    print(f"🔗 Connected to cluster: {cluster_info.get('cluster', 'unknown')}")
+    print(f"📋 Found {info['ns_count']} namespaces")
+    print(f"📋 Kubernetes version: {cluster_info['version']}")
 
-def get_hpa_resources() -> Set[str]:
-    """Get all HPA resources and return a set of their target resource names."""
-    hpa_targets = set()
+def get_api_groups(api_client: client.ApiClient) -> Optional[FrozenSet[str]]:
+    """Get the group/versions served by the cluster, or None if discovery fails."""
+    # Discovery rarely changes, so reuse a recent result of the same context
+    path = cache_path('discovery', cluster_info.get('context', 'unknown'))
+    discovery = load_cache(path, DISCOVERY_TTL, ('groups',))
+    if discovery is None:
+        try:
+            api_groups = client.ApisApi(api_client).get_api_versions()
+        except ApiException as e:
+            print(f"⚠️  Warning: Could not discover API groups: {e}")
+            return None
+        discovery = {
+            'groups': [version.group_version
+                       for group in api_groups.groups or ()
+                       for version in group.versions or ()]
+        }
+        save_cache(path, discovery)
+    return frozenset(discovery['groups'])
+
+def read_list_page(response) -> Dict:
+    """Parse a raw LIST response into plain dicts."""
+    # orjson skips the client's reflective model deserialization entirely
+    try:
+        return orjson.loads(response.data)
+    finally:
+        response.release_conn()
+
+def list_pages(list_fn, **kwargs) -> Iterator[List[Dict]]:
+    """Yield the items of a LIST call page by page, following the continue token."""
+    continue_token = None
+    while True:
+        # Serve the first page from the API server's watch cache instead of a quorum
+        # read from etcd; later pages are pinned to it by the continue token, which
+        # cannot be combined with a resource version
+        resource_version = None if continue_token else '0'
+        response = list_fn(limit=LIST_PAGE_SIZE, _continue=continue_token,
+                           resource_version=resource_version,
+                           _preload_content=False, watch=False, **kwargs)
+        page = read_list_page(response)
+        yield page.get('items') or []
+        continue_token = (page.get('metadata') or {}).get('continue')
+        if not continue_token:
+            return
+
+def prefetch(iterable: Iterable, depth: int) -> Iterator:
+    """Iterate in a background thread, staying up to depth elements ahead of the consumer."""
+    buffer = queue.Queue(maxsize=depth)
+    done = object()
+    
+    def produce():
+        try:
+            for element in iterable:
+                buffer.put((element, None))
+            buffer.put((done, None))
+        except Exception as e:
+            buffer.put((done, e))
+    
+    threading.Thread(target=produce, daemon=True).start()
+    while True:
+        element, error = buffer.get()
+        if element is done:
+            if error is not None:
+                raise error
+            return
+        yield element
+
+def list_all_items(list_fn, **kwargs) -> Iterator[Dict]:
+    """Yield every item of a LIST call, fetching the next pages while this one is processed."""
+    for page in prefetch(list_pages(list_fn, **kwargs), PREFETCH_PAGES):
+        yield from page
+
+def get_scan_namespaces() -> List[str]:
+    """Get the namespaces the scan is limited to, or an empty list for all namespaces."""
+    return [ns.strip() for ns in os.getenv('HPA_SCAN_NAMESPACES', '').split(',') if ns.strip()]
+
+def list_scoped_items(list_all_fn, list_namespaced_fn, **kwargs) -> Iterator[Dict]:
+    """Yield every item of a LIST call, limited to the namespaces selected for the scan."""
+    namespaces = get_scan_namespaces()
+    if not namespaces:
+        yield from list_all_items(list_all_fn, **kwargs)
+        return
+    
+    # List the selected namespaces in parallel instead of the whole cluster
+    def list_namespace(namespace: str) -> List[Dict]:
+        return list(list_all_items(list_namespaced_fn, namespace=namespace, **kwargs))
+    
+    with ThreadPoolExecutor(max_workers=min(len(namespaces), NAMESPACE_FETCH_WORKERS)) as executor:
+        for items in executor.map(list_namespace, namespaces):
+            yield from items
+
+def list_workload_items(list_all_fn, list_namespaced_fn) -> Iterator[Dict]:
+    """Yield the workloads of a LIST call matching the configured namespaces and selectors."""
+    selectors = {}
+    if os.getenv('HPA_SCAN_LABEL_SELECTOR'):
+        selectors['label_selector'] = os.getenv('HPA_SCAN_LABEL_SELECTOR')
+    if os.getenv('HPA_SCAN_FIELD_SELECTOR'):
+        selectors['field_selector'] = os.getenv('HPA_SCAN_FIELD_SELECTOR')
+    return list_scoped_items(list_all_fn, list_namespaced_fn, **selectors)
+
+def summarize_workload(item: Dict) -> Dict:
+    """Reduce a raw workload object to the fields the scanner needs."""
+    metadata = item.get('metadata') or {}
+    spec = item.get('spec') or {}
+    template_spec = (spec.get('template') or {}).get('spec') or {}
+    
+    # Short-circuit on the first container with requests or limits set
+    has_resource_requests = False
+    for container in template_spec.get('containers') or ():
+        resources = container.get('resources')
+        if resources and (resources.get('requests') or resources.get('limits')):
+            has_resource_requests = True
+            break
+    
+    return {
+        'name': metadata.get('name'),
+        'namespace': metadata.get('namespace') or 'default',
+        'replicas': spec.get('replicas'),
+        'has_resource_requests': has_resource_requests
+    }
+
+def get_hpa_resources() -> Dict[str, FrozenSet[Tuple[str, str]]]:
+    """Get all HPA resources and return their (kind, name) targets keyed by namespace."""
+    hpa_targets = defaultdict(set)
+    
+    # Skip the request entirely on clusters that do not serve autoscaling/v2
+    groups = cluster_info.get('groups')
+    if groups is not None and 'autoscaling/v2' not in groups:
+        print("⚠️  Warning: autoscaling/v2 is not available, skipping HPA resources")
+        return {}
     
     try:
-        # Get all HPAs across all namespaces
-        hpa_list = autoscaling_v2.list_horizontal_pod_autoscaler_for_all_namespaces()
+        # Get all HPAs across the scanned namespaces
+        hpa_list = list_scoped_items(autoscaling_v2.list_horizontal_pod_autoscaler_for_all_namespaces,
+                                     autoscaling_v2.list_namespaced_horizontal_pod_autoscaler)
         
-        for hpa in hpa_list.items:
-            if hpa.spec and hpa.spec.scale_target_ref:
-                name = hpa.spec.scale_target_ref.name
-                kind = hpa.spec.scale_target_ref.kind
-                namespace = hpa.metadata.namespace or 'default'
+        for hpa in hpa_list:
+            scale_target_ref = (hpa.get('spec') or {}).get('scaleTargetRef')
+            if scale_target_ref:
+                name = scale_target_ref.get('name')
+                kind = scale_target_ref.get('kind')
+                namespace = (hpa.get('metadata') or {}).get('namespace') or 'default'
                 
-                # Create a unique identifier for the target resource
-                target_id = f"{namespace}/{kind}/{name}"
-                hpa_targets.add(target_id)
+                hpa_targets[namespace].add((kind, name))
                 
     except ApiException as e:
         print(f"⚠️  Warning: Could not fetch HPA resources: {e}")
         
-    return hpa_targets
+    return {namespace: frozenset(targets) for namespace, targets in hpa_targets.items()}
 
-def get_deployments() -> List[client.V1Deployment]:
-    """Get all Deployments across all namespaces."""
+def get_deployments() -> List[Dict]:
+    """Get all Deployments across the scanned namespaces."""
     try:
-        deployment_list = apps_v1.list_deployment_for_all_namespaces()
-        return deployment_list.items
+        items = list_workload_items(apps_v1.list_deployment_for_all_namespaces,
+                                    apps_v1.list_namespaced_deployment)
+        return [summarize_workload(item) for item in items]
     except ApiException as e:
         print(f"❌ Error fetching Deployments: {e}")
         return []
 
-def get_statefulsets() -> List[client.V1StatefulSet]:
-    """Get all StatefulSets across all namespaces."""
+def get_statefulsets() -> List[Dict]:
+    """Get all StatefulSets across the scanned namespaces."""
     try:
-        statefulset_list = apps_v1.list_stateful_set_for_all_namespaces()
-        return statefulset_list.items
+        items = list_workload_items(apps_v1.list_stateful_set_for_all_namespaces,
+                                    apps_v1.list_namespaced_stateful_set)
+        return [summarize_workload(item) for item in items]
     except ApiException as e:
         print(f"❌ Error fetching StatefulSets: {e}")
         return []
 
-def get_replicasets() -> List[client.V1ReplicaSet]:
-    """Get all ReplicaSets across all namespaces."""
+def is_owned_by_deployment(item: Dict) -> bool:
+    """Return True if a raw object is managed by a Deployment."""
+    owners = (item.get('metadata') or {}).get('ownerReferences') or ()
+    return any(owner.get('kind') == 'Deployment' for owner in owners)
+
+def get_replicasets() -> List[Dict]:
+    """Get all ReplicaSets across the scanned namespaces that are not managed by a Deployment."""
     try:
-        replicaset_list = apps_v1.list_replica_set_for_all_namespaces()
-        return replicaset_list.items
+        # ReplicaSets owned by a Deployment are scaled through it, so drop them
+        # before any further work is done on them
+        items = list_workload_items(apps_v1.list_replica_set_for_all_namespaces,
+                                    apps_v1.list_namespaced_replica_set)
+        return [summarize_workload(item) for item in items if not is_owned_by_deployment(item)]
     except ApiException as e:
         print(f"❌ Error fetching ReplicaSets: {e}")
         return []
 
-def check_resource_for_hpa(resources: List, resource_type: str, hpa_targets: Set[str]) -> List[Dict]:
+def check_resource_for_hpa(resources: List[Dict], resource_type: str,
+                           hpa_targets: Dict[str, FrozenSet[Tuple[str, str]]],
+                           skip_ns: FrozenSet[str]) -> List[Finding]:
     """Check if resources have HPA enabled and return those without HPA."""
     resources_without_hpa = []
     
     for resource in resources:
-        name = resource.metadata.name
-        namespace = resource.metadata.namespace or 'default'
+        name = resource['name']
+        namespace = resource['namespace']
         
         # Skip system namespaces
-        if namespace.startswith('kube-') or namespace.startswith('system-'):
+        if namespace in skip_ns:
+            continue
+        
+        # Skip resources that already have HPA
+        if (resource_type, name) in hpa_targets.get(namespace, ()):
             continue
         
-        # Create target identifier
-        target_id = f"{namespace}/{resource_type}/{name}"
+        # Include ONLY if it has NO resource requests/limits AND no HPA
+        # (resources without resource requests are the priority for HPA)
+        if resource['has_resource_requests']:
+            continue
         
-        # Check if this resource has HPA
-        if target_id not in hpa_targets:
-            # Get replicas from spec
-            replicas = 1
-            if hasattr(resource.spec, 'replicas') and resource.spec.replicas:
-                replicas = resource.spec.replicas
-            
-            # Check if the resource has resource requests/limits that would benefit from HPA
-            has_resource_requests = False
-            if hasattr(resource.spec, 'template') and resource.spec.template:
-                template = resource.spec.template
-                if hasattr(template, 'spec') and template.spec:
-                    containers = template.spec.containers or []
-                    for container in containers:
-                        if hasattr(container, 'resources') and container.resources:
-                            if container.resources.requests or container.resources.limits:
-                                has_resource_requests = True
-                                break
-            
-            # Include ONLY if it has NO resource requests/limits AND no HPA
-            # (resources without resource requests are the priority for HPA)
-            if not has_resource_requests:
-                resources_without_hpa.append({
-                    'name': name,
-                    'namespace': namespace,
-                    'type': resource_type,
-                    'replicas': replicas,
-                    'has_resource_requests': has_resource_requests
-                })
+        resources_without_hpa.append(Finding(
+            name=name,
+            namespace=namespace,
+            type=resource_type,
+            replicas=resource['replicas'] or 1,
+            has_resource_requests=False
+        ))
     
     return resources_without_hpa
 
+def group_by_namespace(resources: List[Finding]) -> Iterator[Tuple[str, Iterator[Finding]]]:
+    """Sort resources by namespace in place and yield them grouped per namespace."""
+    resources.sort(key=attrgetter('namespace'))
+    return groupby(resources, key=attrgetter('namespace'))
+
 def scan_cluster():
     """Main function to scan for resources without HPA."""
     print("\n" + "=" * 60)
@@ -191,37 +442,40 @@ def scan_cluster():
     print(f"🏢 Cluster: {cluster_info.get('cluster', 'unknown')}")
     print(f"👤 User: {cluster_info.get('user', 'unknown')}")
     print(f"🔧 Method: Kubernetes Python Client Library (not kubectl)")
+    if get_scan_namespaces():
+        print(f"🎯 Namespaces: {', '.join(get_scan_namespaces())}")
     print("=" * 60)
     print("🔍 Scanning cluster for resources without HPA...")
     print("💡 Looking for resources with NO resource requests/limits (priority for HPA)")
     
-    # Get HPA targets first
-    print("📊 Fetching HPA resources...")
-    hpa_targets = get_hpa_resources()
-    
-    # Get all resources that can use HPA
-    print("📊 Fetching Deployments...")
-    deployments = get_deployments()
-    
-    print("📊 Fetching StatefulSets...")
-    statefulsets = get_statefulsets()
-    
-    print("📊 Fetching ReplicaSets...")
-    replicasets = get_replicasets()
+    # Fetch HPA targets and all resources that can use HPA in parallel
+    print("📊 Fetching HPA resources, Deployments, StatefulSets and ReplicaSets...")
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        f_hpa = executor.submit(get_hpa_resources)
+        f_deployments = executor.submit(get_deployments)
+        f_statefulsets = executor.submit(get_statefulsets)
+        f_replicasets = executor.submit(get_replicasets)
+        
+        hpa_targets = f_hpa.result()
+        deployments = f_deployments.result()
+        statefulsets = f_statefulsets.result()
+        replicasets = f_replicasets.result()
     
     # Check each resource type
+    # Namespaces named explicitly in HPA_SCAN_NAMESPACES are scanned even if they are system namespaces
+    skip_ns = cluster_info.get('skip_ns', frozenset()).difference(get_scan_namespaces())
     all_resources_without_hpa = []
     
     print("📊 Checking Deployments...")
-    deployments_without_hpa = check_resource_for_hpa(deployments, 'Deployment', hpa_targets)
+    deployments_without_hpa = check_resource_for_hpa(deployments, 'Deployment', hpa_targets, skip_ns)
     all_resources_without_hpa.extend(deployments_without_hpa)
     
     print("📊 Checking StatefulSets...")
-    statefulsets_without_hpa = check_resource_for_hpa(statefulsets, 'StatefulSet', hpa_targets)
+    statefulsets_without_hpa = check_resource_for_hpa(statefulsets, 'StatefulSet', hpa_targets, skip_ns)
     all_resources_without_hpa.extend(statefulsets_without_hpa)
     
     print("📊 Checking ReplicaSets...")
-    replicasets_without_hpa = check_resource_for_hpa(replicasets, 'ReplicaSet', hpa_targets)
+    replicasets_without_hpa = check_resource_for_hpa(replicasets, 'ReplicaSet', hpa_targets, skip_ns)
     all_resources_without_hpa.extend(replicasets_without_hpa)
     
     # Display results
@@ -235,20 +489,12 @@ def scan_cluster():
         print(f"Found {len(all_resources_without_hpa)} resources without HPA:")
         print()
         
-        # Group by namespace
-        by_namespace = {}
-        for resource in all_resources_without_hpa:
-            namespace = resource['namespace']
-            if namespace not in by_namespace:
-                by_namespace[namespace] = []
-            by_namespace[namespace].append(resource)
-        
-        for namespace in sorted(by_namespace.keys()):
+        for namespace, resources in group_by_namespace(all_resources_without_hpa):
             print(f"📁 Namespace: {namespace}")
-            for resource in by_namespace[namespace]:
-                replicas_info = f"replicas={resource['replicas']}"
-                resources_info = "has resource requests" if resource['has_resource_requests'] else "no resource requests"
-                print(f"  • {resource['type']}/{resource['name']} ({replicas_info}, {resources_info})")
+            for resource in resources:
+                replicas_info = f"replicas={resource.replicas}"
+                resources_info = "has resource requests" if resource.has_resource_requests else "no resource requests"
+                print(f"  • {resource.type}/{resource.name} ({replicas_info}, {resources_info})")
             print()
     
     # Summary statistics
@@ -275,27 +521,103 @@ def scan_cluster():
         print("\n✅ All eligible resources have HPA enabled!")
         return 0
 
-def generate_pdf_report(all_resources_without_hpa: List[Dict], deployments: List, statefulsets: List, replicasets: List, output_file: str = None):
+def draw_flowables(pdf: canvas.Canvas, flowables: List, y: float) -> float:
+    """Draw Platypus flowables top-down on the canvas starting at y and return the new y."""
+    width = PAGE_WIDTH - 2 * PDF_MARGIN
+    for flowable in flowables:
+        y -= flowable.getSpaceBefore()
+        _, height = flowable.wrapOn(pdf, width, y - PDF_MARGIN)
+        if y - height < PDF_MARGIN:
+            pdf.showPage()
+            y = PAGE_HEIGHT - PDF_MARGIN
+        flowable.drawOn(pdf, PDF_MARGIN, y - height)
+        y -= height + flowable.getSpaceAfter()
+    return y
+
+def wrap_text(text: str, font_name: str, font_size: float, width: float) -> List[str]:
+    """Split text into lines that fit in the given width, breaking between characters."""
+    # Resource names have no spaces, so break anywhere rather than dropping characters
+    lines = []
+    line = ''
+    for char in text:
+        if line and stringWidth(line + char, font_name, font_size) > width:
+            lines.append(line)
+            line = ''
+        line += char
+    lines.append(line)
+    return lines
+
+def draw_resource_table(pdf: canvas.Canvas, groups: Iterable[Tuple[str, Iterable[Finding]]], y: float) -> float:
+    """Draw the resources table row by row in a single pass and return the new y."""
+    col_x = [PDF_MARGIN]
+    for col_width in RESOURCE_COL_WIDTHS:
+        col_x.append(col_x[-1] + col_width)
+    table_width = col_x[-1] - col_x[0]
+    
+    def draw_row(cells: List[str], font_name: str, font_size: float, background, text_color, span: bool = False):
+        nonlocal y
+        # Wrap long values onto extra lines so that full names are always shown
+        if span:
+            cell_lines = [wrap_text(cells[0], font_name, font_size, table_width - 12)]
+        else:
+            cell_lines = [wrap_text(cell, font_name, font_size, RESOURCE_COL_WIDTHS[i] - 12)
+                          for i, cell in enumerate(cells)]
+        line_height = font_size + 2
+        line_count = max(len(lines) for lines in cell_lines)
+        row_height = RESOURCE_ROW_HEIGHT + (line_count - 1) * line_height
+        
+        # Break the page manually, repeating the header row on the new page
+        if y - row_height < PDF_MARGIN:
+            pdf.showPage()
+            y = PAGE_HEIGHT - PDF_MARGIN
+            if cells is not RESOURCE_COLUMNS:
+                draw_row(RESOURCE_COLUMNS, 'Helvetica-Bold', 10, colors.lightblue, colors.whitesmoke)
+        
+        bottom = y - row_height
+        pdf.setFillColor(background)
+        pdf.rect(col_x[0], bottom, table_width, row_height, stroke=0, fill=1)
+        pdf.setFillColor(text_color)
+        pdf.setFont(font_name, font_size)
+        for i, lines in enumerate(cell_lines):
+            # Center each cell's lines vertically within the row
+            text_y = (y + bottom + (len(lines) - 1) * line_height - font_size) / 2 + 2
+            for line in lines:
+                if span:
+                    pdf.drawString(col_x[0] + 6, text_y, line)
+                else:
+                    pdf.drawCentredString((col_x[i] + col_x[i + 1]) / 2, text_y, line)
+                text_y -= line_height
+        if span:
+            pdf.rect(col_x[0], bottom, table_width, row_height, stroke=1, fill=0)
+        else:
+            pdf.grid(col_x, [y, bottom])
+        y = bottom
+    
+    pdf.setStrokeColor(colors.black)
+    pdf.setLineWidth(1)
+    draw_row(RESOURCE_COLUMNS, 'Helvetica-Bold', 10, colors.lightblue, colors.whitesmoke)
+    for namespace, resources in groups:
+        draw_row([f"Namespace: {namespace}"], 'Helvetica-Bold', 9, colors.lightgrey, colors.black, span=True)
+        for resource in resources:
+            has_requests = "Yes" if resource.has_resource_requests else "No"
+            draw_row([resource.type, resource.name, str(resource.replicas), has_requests],
+                     'Helvetica', 9, colors.white, colors.black)
+    
+    return y - 12
+
+def generate_pdf_report(all_resources_without_hpa: List[Finding], deployments: List, statefulsets: List, replicasets: List, output_file: str = None):
     """Generate a PDF report with the HPA scan results."""
     if output_file is None:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         output_file = f"hpa-scan-report_{timestamp}.pdf"
     
-    # Create PDF document
-    doc = SimpleDocTemplate(output_file, pagesize=A4)
-    styles = getSampleStyleSheet()
+    # Create PDF canvas
+    pdf = canvas.Canvas(output_file, pagesize=A4)
+    styles = PDF_STYLES
     story = []
     
     # Title
-    title_style = ParagraphStyle(
-        'CustomTitle',
-        parent=styles['Heading1'],
-        fontSize=18,
-        spaceAfter=30,
-        alignment=1,  # Center alignment
-        textColor=colors.darkblue
-    )
-    story.append(Paragraph("Kubernetes HPA Scanner Report", title_style))
+    story.append(Paragraph("Kubernetes HPA Scanner Report", TITLE_STYLE))
     story.append(Spacer(1, 12))
     
     # Report info
@@ -317,68 +639,24 @@ def generate_pdf_report(all_resources_without_hpa: List[Dict], deployments: List
     
     # Align table with the "S" of "Summary"
     summary_table = Table(summary_data, colWidths=[3*inch, 1.5*inch], hAlign='LEFT')
-    summary_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 12),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE')
-    ]))
+    summary_table.setStyle(SUMMARY_TABLE_STYLE)
     story.append(summary_table)
     story.append(Spacer(1, 20))
     
     # Resources without HPA
     if all_resources_without_hpa:
         story.append(Paragraph("Resources Without HPA", styles['Heading2']))
-        
-        # Group by namespace
-        by_namespace = {}
-        for resource in all_resources_without_hpa:
-            namespace = resource['namespace']
-            if namespace not in by_namespace:
-                by_namespace[namespace] = []
-            by_namespace[namespace].append(resource)
-        
-        for namespace in sorted(by_namespace.keys()):
-            story.append(Paragraph(f"<b>Namespace: {namespace}</b>", styles['Heading3']))
-            
-            # Create table for this namespace
-            table_data = [['Resource Type', 'Name', 'Replicas', 'RR']]
-            for resource in by_namespace[namespace]:
-                has_requests = "Yes" if resource['has_resource_requests'] else "No"
-                table_data.append([
-                    resource['type'],
-                    resource['name'],
-                    str(resource['replicas']),
-                    has_requests
-                ])
-            
-            # Adjust column widths to accommodate longer pod names
-            resource_table = Table(table_data, colWidths=[1.2*inch, 3*inch, 0.8*inch, 1.2*inch])
-            resource_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.lightblue),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, 0), 10),
-                ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                ('BACKGROUND', (0, 1), (-1, -1), colors.white),
-                ('GRID', (0, 0), (-1, -1), 1, colors.black),
-                ('FONTSIZE', (0, 1), (-1, -1), 9),
-                ('VALIGN', (0, 0), (-1, -1), 'MIDDLE')
-            ]))
-            story.append(resource_table)
-            story.append(Spacer(1, 12))
     else:
         story.append(Paragraph("✅ All eligible resources have HPA enabled!", styles['Normal']))
     
+    # Title, report info and summary are laid out with Platypus
+    y = draw_flowables(pdf, story, PAGE_HEIGHT - PDF_MARGIN)
+    
+    if all_resources_without_hpa:
+        y = draw_resource_table(pdf, group_by_namespace(all_resources_without_hpa), y)
+    
     # Recommendations
-    story.append(Spacer(1, 20))
-    story.append(Paragraph("Recommendations", styles['Heading2']))
+    story = [Spacer(1, 20), Paragraph("Recommendations", styles['Heading2'])]
     recommendations = [
         "• Enable HPA for resources with multiple replicas to handle traffic spikes",
         "• Set resource requests/limits for resources without them to enable proper scaling",
@@ -392,7 +670,8 @@ def generate_pdf_report(all_resources_without_hpa: List[Dict], deployments: List
         story.append(Spacer(1, 6))
     
     # Build PDF
-    doc.build(story)
+    draw_flowables(pdf, story, y)
+    pdf.save()
     print(f"📄 PDF report generated: {output_file}")
     return output_file
 